@@ -118,6 +118,15 @@ async def open_cached_client(
 
     '''
     brokermod = get_brokermod(brokername)
+
+    # NOTE: ``maybe_open_context()`` already does all the consumer
+    # ref-counting and single-allocation we need:
+    # - its (task) lock is per-``acm_func`` and thus per-broker, so
+    #   client handshakes for different backends never serialize.
+    # - the first consumer enters ``.get_client()`` in an actor-wide
+    #   service nursery while any concurrent consumers wait and then
+    #   get a cache hit on the same client instance.
+    # - only the last exiting consumer triggers client teardown.
     async with maybe_open_context(
         acm_func=brokermod.get_client,
     ) as (cache_hit, client):
@@ -20,9 +20,9 @@ Handy cross-broker utils.
 """
 from functools import partial
 
-import json
 import asks
 import logging
+import msgspec
 
 from ..log import (
     get_logger,
@@ -40,6 +40,11 @@ get_console_log = partial(
 )
 
 
+# reused across responses to avoid re-allocating decoder state on
+# every (hot path) broker HTTP request.
+_json_decoder = msgspec.json.Decoder()
+
+
 class BrokerError(Exception):
     "Generic broker issue"
 
@@ -99,12 +104,19 @@ def resproc(
     if not resp.status_code == 200:
         raise BrokerError(resp.body)
     try:
-        msg = resp.json()
-    except json.decoder.JSONDecodeError:
+        # NOTE: decode the raw body bytes directly instead of
+        # ``resp.json()`` which goes through the (much slower) stdlib
+        # ``json`` parser.
+        msg = _json_decoder.decode(resp.body)
+    except msgspec.DecodeError:
         log.exception(f"Failed to process {resp}:\n{resp.text}")
         raise BrokerError(resp.text)
 
-    if log_resp:
+    if (
+        log_resp
+        # don't re-serialize the msg unless it'll actually be emitted
+        and log.isEnabledFor(logging.DEBUG)
+    ):
         log.debug(f"Received json contents:\n{colorize_json(msg)}")
 
     return msg if return_json else resp
@@ -609,9 +609,9 @@ class OHLCBarsFmtr(IncrementalFormatter):
         np.ndarray,
     ]:
         '''
-        More or less direct proxy to the ``numba``-fied
-        ``path_arrays_from_ohlc()`` (above) but with closed in kwargs
-        for line spacing.
+        More or less direct proxy to ``path_arrays_from_ohlc()``
+        (whose vertex fill is a compiled ``numba`` kernel) but with
+        closed in kwargs for line spacing.
 
         '''
         x, y, c = path_arrays_from_ohlc(
@@ -620,7 +620,7 @@ class OHLCBarsFmtr(IncrementalFormatter):
             bar_w=self.index_step_size,
             bar_gap=w * self.index_step_size,
 
-            # XXX: don't ask, due to a ``numba`` bug..
+            # which struct field to read out as the x-domain index
             use_time_index=(self.index_field == 'time'),
         )
         return x, y, c
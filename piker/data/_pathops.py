@@ -29,6 +29,7 @@ from numba import (
     njit,
     float64,
     int64,
+    void,
     # optional,
 )
 
@@ -87,21 +88,76 @@ def xy_downsample(
 
 
 @njit(
-    # NOTE: need to construct this manually for readonly
-    # arrays, see https://github.com/numba/numba/issues/4511
-    # (
-    #     types.Array(
-    #         numba_ohlc_dtype,
-    #         1,
-    #         'C',
-    #         readonly=True,
-    #     ),
-    #     int64,
-    #     types.unicode_type,
-    #     optional(float64),
-    # ),
-    nogil=True
+    # NOTE: an explicit signature means the kernel is compiled
+    # eagerly (at import, from the on-disk cache after the first run)
+    # instead of on the first chart draw.
+    void(
+        float64[::1],  # index
+        float64[::1],  # open
+        float64[::1],  # high
+        float64[::1],  # low
+        float64[::1],  # close
+        float64,  # bar_w
+        float64,  # bar_gap
+        float64[::1],  # x_out
+        float64[::1],  # y_out
+        float64[::1],  # c_out
+    ),
+    cache=True,
+    nogil=True,
 )
+def _fill_ohlc_lines(
+    index: np.ndarray,
+    o: np.ndarray,
+    h: np.ndarray,
+    l: np.ndarray,
+    c: np.ndarray,
+    bar_w: float64,
+    bar_gap: float64,
+
+    # outputs, written in place
+    x_out: np.ndarray,
+    y_out: np.ndarray,
+    c_out: np.ndarray,
+
+) -> None:
+    '''
+    Fill the 6 path vertices for every bar from flat (SoA) float64
+    OHLC columns in a single pass with no intermediate arrays.
+
+    '''
+    half_w: float = bar_w/2
+    for i in range(index.shape[0]):
+        x0: float = index[i]
+        mid: float = x0 + half_w
+        istart: int = i * 6
+
+        # x,y detail the 6 points which connect all vertexes of a ohlc bar
+        x_out[istart] = x0 + bar_gap
+        x_out[istart + 1] = mid
+        x_out[istart + 2] = mid
+        x_out[istart + 3] = mid
+        x_out[istart + 4] = mid
+        x_out[istart + 5] = x0 + bar_w - bar_gap
+
+        y_out[istart] = o[i]
+        y_out[istart + 1] = o[i]
+        y_out[istart + 2] = l[i]
+        y_out[istart + 3] = h[i]
+        y_out[istart + 4] = c[i]
+        y_out[istart + 5] = c[i]
+
+        # specifies that the first edge is never connected to the
+        # prior bars last edge thus providing a small "gap"/"space"
+        # between bars determined by ``bar_gap``.
+        c_out[istart] = 1
+        c_out[istart + 1] = 1
+        c_out[istart + 2] = 1
+        c_out[istart + 3] = 1
+        c_out[istart + 4] = 1
+        c_out[istart + 5] = 0
+
+
 def path_arrays_from_ohlc(
     data: np.ndarray,
     start: int64,
@@ -109,9 +165,6 @@ def path_arrays_from_ohlc(
     bar_gap: float64 = 0.16,
     use_time_index: bool = True,
 
-    # XXX: ``numba`` issue: https://github.com/numba/numba/issues/8622
-    # index_field: str,
-
 ) -> tuple[
     np.ndarray,
     np.ndarray,
@@ -120,67 +173,51 @@ def path_arrays_from_ohlc(
     '''
     Generate an array of lines objects from input ohlc data.
 
+    Each OHLC column is read out exactly once as a contiguous
+    (SoA) float64 array and handed to the compiled
+    ``_fill_ohlc_lines()`` kernel which writes all 6 vertices per
+    bar directly into the flat outputs.
+
     '''
     size = int(data.shape[0] * 6)
 
-    # XXX: see this for why the dtype might have to be defined outside
-    # the routine.
-    # https://github.com/numba/numba/issues/4098#issuecomment-493914533
-    x = np.zeros(
+    # NOTE: every slot from ``start`` onward is written below so only
+    # the (normally empty) leading section needs zero-ing.
+    x = np.empty(
         shape=size,
-        dtype=float64,
+        dtype=np.float64,
     )
-    y, c = x.copy(), x.copy()
-
-    half_w: float = bar_w/2
-
-    # TODO: report bug for assert @
-    # /home/goodboy/repos/piker/env/lib/python3.8/site-packages/numba/core/typing/builtins.py:991
-    for i, q in enumerate(data[start:], start):
-
-        open = q['open']
-        high = q['high']
-        low = q['low']
-        close = q['close']
-
-        if use_time_index:
-            index = float64(q['time'])
-        else:
-            index = float64(q['index'])
-
-        # XXX: ``numba`` issue: https://github.com/numba/numba/issues/8622
-        # index = float64(q[index_field])
-        # AND this (probably)
-        # open, high, low, close, index = q[
-        #     ['open', 'high', 'low', 'close', 'index']]
-
-        istart = i * 6
-        istop = istart + 6
-
-        # x,y detail the 6 points which connect all vertexes of a ohlc bar
-        mid: float = index + half_w
-        x[istart:istop] = (
-            index + bar_gap,
-            mid,
-            mid,
-            mid,
-            mid,
-            index + bar_w - bar_gap,
+    y = np.empty_like(x)
+    c = np.empty_like(x)
+    istart: int = start * 6
+    x[:istart] = y[:istart] = c[:istart] = 0
+
+    src = data[start:]
+    if not src.size:
+        return x, y, c
+
+    # NOTE: struct-array field views are strided (and shm buffers may
+    # be read-only) so copy each column out to a contiguous float64
+    # array such that the kernel is only ever compiled for a single
+    # (C-layout) signature.
+    def col(name: str) -> np.ndarray:
+        return np.ascontiguousarray(
+            src[name],
+            dtype=np.float64,
         )
-        y[istart:istop] = (
-            open,
-            open,
-            low,
-            high,
-            close,
-            close,
-        )
-
-        # specifies that the first edge is never connected to the
-        # prior bars last edge thus providing a small "gap"/"space"
-        # between bars determined by ``bar_gap``.
-        c[istart:istop] = (1, 1, 1, 1, 1, 0)
 
+    _fill_ohlc_lines(
+        col('time' if use_time_index else 'index'),
+        col('open'),
+        col('high'),
+        col('low'),
+        col('close'),
+        float(bar_w),
+        float(bar_gap),
+        x[istart:],
+        y[istart:],
+        c[istart:],
+    )
     return x, y, c
 
 
@@ -211,6 +248,11 @@ def hl2mxmn(
 @njit(
     # TODO: the type annots..
     # float64[:](float64[:],),
+    # XXX: the input is an ohlc struct-array (record) type so for
+    # now just rely on the on-disk cache to avoid re-jitting on every
+    # (first) call per process.
+    cache=True,
+    nogil=True,
 )
 def trace_hl(
     hl: 'np.ndarray',
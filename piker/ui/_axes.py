@@ -37,6 +37,17 @@ from ._interaction import ChartView
 _axis_pen = pg.mkPen(hcolor('bracket'))
 
 
+@lru_cache
+def price_fmt(digits: int) -> Callable[[float], str]:
+    '''
+    Return a (cached) thousands-delimited, fixed ``digits`` precision
+    formatter with the precision pre-resolved such that calls don't
+    re-parse a nested format-spec.
+
+    '''
+    return ('{:,.%df}' % digits).format
+
+
 class Axis(pg.AxisItem):
     '''
     A better axis that sizes tick contents considering font size.
@@ -268,11 +279,9 @@ class PriceAxis(Axis):
         # print(f'digits: {digits}')
 
         if not self.formatter:
+            fmt = price_fmt(digits)
             return [
-                ('{value:,.{digits}f}').format(
-                    digits=digits,
-                    value=v,
-                ).replace(',', ' ') for v in vals
+                fmt(v).replace(',', ' ') for v in vals
             ]
         else:
             return list(map(self.formatter, vals))
@@ -453,6 +462,11 @@ class AxisLabel(pg.GraphicsObject):
             # can be overrided in subtype
             self.draw(p, self.rect)
 
+            # NOTE: no need for a ``QStaticText`` (or similar) glyph
+            # cache here: the item's ``DeviceCoordinateCache`` (set in
+            # ``.__init__()``) already has Qt blit a cached pixmap on
+            # hover/scroll/cursor repaints and this is only re-entered
+            # after an explicit ``.update()`` with new ``.label_str``.
             p.setFont(self._dpifont.font)
             p.setPen(self.fg_color)
             p.drawText(
@@ -634,6 +648,10 @@ class YAxisLabel(AxisLabel):
         self._pi = pi
         pi.sigRangeChanged.connect(self.update_on_resize)
 
+        # pre-resolve the value precision once instead of re-parsing
+        # a nested format-spec on every (cursor driven) update.
+        self._value_fmt = price_fmt(self.digits)
+
         self._last_datum = (None, None)
 
         self.x_offset = 0
@@ -660,8 +678,7 @@ class YAxisLabel(AxisLabel):
     ) -> None:
 
         # this is read inside ``.paint()``
-        self.label_str = '{value:,.{digits}f}'.format(
-            digits=self.digits, value=value).replace(',', ' ')
+        self.label_str = self._value_fmt(value).replace(',', ' ')
 
         # pull text offset from axis from parent axis
         x_offset = x_offset or self.x_offset
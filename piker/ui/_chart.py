@@ -788,7 +788,11 @@ class LinkedSplits(QWidget):
             ):
                 self.cursor.add_plot(cpw)
                 if style != 'ohlc_bar':
-                    self.cursor.add_curve_cursor(cpw, graphics)
+                    self.cursor.add_curve_cursor(
+                        cpw,
+                        graphics,
+                        viz=viz,
+                    )
 
                 if add_label:
                     self.cursor.contents_labels.add_label(
@@ -25,7 +25,6 @@ from typing import (
     TYPE_CHECKING,
 )
 
-import inspect
 import numpy as np
 import pyqtgraph as pg
 from PyQt5 import QtCore, QtWidgets
@@ -48,6 +47,8 @@ if TYPE_CHECKING:
         ChartPlotWidget,
         LinkedSplits,
     )
+    from ._dataviz import Viz
+    from ..data._sharedmem import ShmArray
 
 
 log = get_logger(__name__)
@@ -57,9 +58,22 @@ log = get_logger(__name__)
 # there's an improvement if you want to change it!
 
 _mouse_rate_limit = 60  # TODO; should we calc current screen refresh rate?
-_debounce_delay = 0
 _ch_label_opac = 1
 
+# crosshair pens, shared by all cursors (and their per-plot lines)
+_ch_pen = pg.mkPen(
+    color=hcolor('bracket'),
+    style=QtCore.Qt.DashLine,
+)
+_ch_lines_pen = pg.mkPen(
+    color=hcolor('davies'),
+    style=QtCore.Qt.DashLine,
+)
+
+# cached as a plain int for a cheap (non ``isinstance()``) event type
+# check in ``LineDot.event()``.
+_DYN_PROP: int = int(QtCore.QEvent.DynamicPropertyChange)
+
 
 # TODO: we need to handle the case where index is outside
 # the underlying datums range
@@ -72,6 +86,7 @@ class LineDot(pg.CurvePoint):
         index: int,
 
         plot: ChartPlotWidget,  # type: ingore # noqa
+        viz: Viz,
         pos=None,
         color: str = 'bracket',
 
@@ -87,6 +102,13 @@ class LineDot(pg.CurvePoint):
             rotate=False,
         )
         self._plot = plot
+        self._viz = viz
+
+        # ``(shm first, shm last, first x, size, index column, y
+        # column)`` of the viz's source array, see ``.get_cols()``.
+        self._cols: tuple[
+            int, int, float, int, np.ndarray, np.ndarray
+        ] | None = None
 
         # TODO: get pen from curve if not defined?
         cdefault = hcolor(color)
@@ -106,6 +128,43 @@ class LineDot(pg.CurvePoint):
         # keep a static size
         self.setFlag(self.ItemIgnoresTransformations)
 
+    def get_cols(self) -> tuple[
+        int, int, float, int, np.ndarray, np.ndarray
+    ]:
+        '''
+        Return ``(shm first, shm last, first x, size, index column,
+        y column)`` for the viz's source array.
+
+        The column views share the shm buffer so they (and the
+        loop-invariant first x and size) are only re-read when the
+        array's bounds change (eg. on a new sample or history
+        prepend), not on every mouse move.
+
+        '''
+        viz = self._viz
+        shm = viz.shm
+        first: int = shm._first.value
+        last: int = shm._last.value
+
+        cols = self._cols
+        if (
+            cols is None
+            or cols[0] != first
+            or cols[1] != last
+        ):
+            array = shm._array[first:last]
+            index = array[viz.index_field]
+            cols = self._cols = (
+                first,
+                last,
+                float(index[0]) if index.size else 0.,
+                index.size,
+                index,
+                array[viz.name],
+            )
+
+        return cols
+
     def event(
         self,
         ev: QtCore.QEvent,
@@ -113,7 +172,7 @@ class LineDot(pg.CurvePoint):
     ) -> bool:
 
         if (
-            not isinstance(ev, QtCore.QDynamicPropertyChangeEvent)
+            ev.type() != _DYN_PROP
             or self.curve() is None
         ):
             return False
@@ -139,27 +198,92 @@ class LineDot(pg.CurvePoint):
         return False
 
 
+def update_dots(
+    dots: list[LineDot],
+    ix: float,
+
+) -> None:
+    '''
+    Move all curve ``dots`` to their datum at x-index ``ix`` in
+    a single pass.
+
+    This bypasses ``pg.CurvePoint.setIndex()`` which routes through
+    a Qt dynamic-property-change event and the curve's
+    ``.getData()``; instead we binary search each ``Viz``'s source
+    index directly.
+
+    Dots which read from the same shm buffer (normally all curves
+    on a given plot) share an index column, so the binary search is
+    only done once per distinct buffer (and bounds) instead of once
+    per dot; each dot then only does a y-column read and a direct
+    ``.setPos()``.
+
+    '''
+    setPos = QtWidgets.QGraphicsItem.setPos
+    last_key: tuple | None = None
+    i: int = 0
+    in_range: bool = False
+
+    for dot in dots:
+        first, last, x0, size, index, y = dot.get_cols()
+        key = (dot._viz.shm, first, last)
+        if key != last_key:
+            last_key = key
+            i = index.searchsorted(ix)
+
+            # only when in the datums range
+            in_range = (
+                i < size
+                and ix >= x0
+            )
+
+        if in_range:
+            setPos(dot, ix, y[i])
+
+
+# (vertical, horizontal) corner -> (item/parent anchor point, margins)
+# where anchor points are in (x, y) order and built once at import.
+# XXX: fyi naming here is confusing / opposite to coords
+_corners: dict[
+    tuple[str, str],
+    tuple[QPointF, tuple[int, Callable[[int], float]]],
+] = {
+    ('top', 'left'): (
+        QPointF(0, 0),
+        (-2, lambda font_size: -font_size*0.25),
+    ),
+    ('top', 'right'): (
+        QPointF(1, 0),
+        (2, lambda font_size: -font_size*0.25),
+    ),
+    ('bottom', 'left'): (
+        QPointF(0, 1),
+        (-2, lambda font_size: font_size),
+    ),
+    ('bottom', 'right'): (
+        QPointF(1, 1),
+        (2, lambda font_size: font_size),
+    ),
+}
+
+
 # TODO: change this into our own ``_label.Label``
 class ContentsLabel(pg.LabelItem):
     """Label anchored to a ``ViewBox`` typically for displaying
     datum-wise points from the "viewed" contents.
 
     """
-    _corner_anchors = {
-        'top': 0,
-        'left': 0,
-        'bottom': 1,
-        'right': 1,
-    }
-
-    # XXX: fyi naming here is confusing / opposite to coords
-    _corner_margins = {
-        ('top', 'left'): (-2, lambda font_size: -font_size*0.25),
-        ('top', 'right'): (2, lambda font_size: -font_size*0.25),
-
-        ('bottom', 'left'): (-2, lambda font_size: font_size),
-        ('bottom', 'right'): (2, lambda font_size: font_size),
-    }
+    # this being "html" is the dumbest shit :eyeroll:
+    _ohlc_tmpl: str = (
+        '<b>i</b>:%d<br/>'
+        '<b>epoch</b>:%s<br/>'
+        '<b>O</b>:%s<br/>'
+        '<b>H</b>:%s<br/>'
+        '<b>L</b>:%s<br/>'
+        '<b>C</b>:%s<br/>'
+        '<b>V</b>:%s<br/>'
+        '<b>wap</b>:%s'
+    )
 
     def __init__(
         self,
@@ -167,7 +291,7 @@ class ContentsLabel(pg.LabelItem):
         # chart: ChartPlotWidget,  # noqa
         view: pg.ViewBox,
 
-        anchor_at: str = ('top', 'right'),
+        anchor_at: tuple[str, str] = ('top', 'right'),
         justify_text: str = 'left',
         font_size: int | None = None,
 
@@ -186,50 +310,74 @@ class ContentsLabel(pg.LabelItem):
         self.vb = view
         view.scene().addItem(self)
 
-        v, h = anchor_at
-        index = (self._corner_anchors[h], self._corner_anchors[v])
-        margins = self._corner_margins[(v, h)]
+        # NOTE: ``pg.LabelItem.setText()`` re-builds its css ``<span>``
+        # wrapper (including a ``QColor`` lookup) on every call; since
+        # our style never changes, render that wrapper once and
+        # pre-join it with the datum templates such that each update
+        # is a single printf-style format of only the numeric fields.
+        color = self.opts['color'] or pg.getConfigOption('foreground')
+        self._span: str = (
+            "<span style='color: %s; font-size: %s'>" % (
+                pg.mkColor(color).name(),
+                self.opts['size'],
+            )
+        )
+        self._ohlc_html: str = self._span + self._ohlc_tmpl + '</span>'
+        self._value_html: str = self._span + '%s: %.2f</span>'
+
+        # last rendered html, see ``.set_html()``.
+        self._last_html: str = ''
+
+        # NOTE: ``anchor_at`` is in (vertical, horizontal) order
+        index, (x_margin, y_margin) = _corners[tuple(anchor_at)]
+
+        # NOTE: y-margins are always font size relative.
+        self.anchor(
+            itemPos=index,
+            parentPos=index,
+            offset=(x_margin, y_margin(font_size)),
+        )
+
+    def set_html(
+        self,
+        html: str,
+    ) -> None:
+        '''
+        Only (re)set the underlying text item's html when it actually
+        changed since doing so triggers a full re-parse and re-layout
+        in Qt.
 
-        ydim = margins[1]
-        if inspect.isfunction(margins[1]):
-            margins = margins[0], ydim(font_size)
+        '''
+        if html != self._last_html:
+            self._last_html = html
+            self.item.setHtml(html)
 
-        self.anchor(itemPos=index, parentPos=index, offset=margins)
+            # same layout updates as ``pg.LabelItem.setText()``
+            self.updateMin()
+            self.resizeEvent(None)
+            self.updateGeometry()
 
     def update_from_ohlc(
         self,
 
         name: str,
         ix: int,
-        array: np.ndarray,
+        cols: dict[str, np.ndarray],
 
     ) -> None:
-        # this being "html" is the dumbest shit :eyeroll:
-
-        self.setText(
-            "<b>i</b>:{index}<br/>"
-            # NB: these fields must be indexed in the correct order via
-            # the slice syntax below.
-            "<b>epoch</b>:{}<br/>"
-            "<b>O</b>:{}<br/>"
-            "<b>H</b>:{}<br/>"
-            "<b>L</b>:{}<br/>"
-            "<b>C</b>:{}<br/>"
-            "<b>V</b>:{}<br/>"
-            "<b>wap</b>:{}".format(
-                *array[ix][
-                    [
-                        'time',
-                        'open',
-                        'high',
-                        'low',
-                        'close',
-                        'volume',
-                        'bar_wap',
-                    ]
-                ],
-                # name=name,
-                index=ix,
+        # NOTE: ``.item()`` reads out native python scalars directly
+        # which both skips boxing numpy scalars and uses the (much
+        # faster) built-in float -> str conversion when formatting.
+        self.set_html(
+            self._ohlc_html % (
+                ix,
+                cols['time'].item(ix),
+                cols['open'].item(ix),
+                cols['high'].item(ix),
+                cols['low'].item(ix),
+                cols['close'].item(ix),
+                cols['volume'].item(ix),
+                cols['bar_wap'].item(ix),
             )
         )
 
@@ -238,11 +386,10 @@ class ContentsLabel(pg.LabelItem):
 
         name: str,
         ix: int,
-        array: np.ndarray,
+        cols: dict[str, np.ndarray],
 
     ) -> None:
-        data = array[ix][name]
-        self.setText(f"{name}: {data:.2f}")
+        self.set_html(self._value_html % (name, cols[name].item(ix)))
 
 
 class ContentsLabels:
@@ -265,6 +412,62 @@ class ContentsLabels:
             Callable
         )] = []
 
+        # per-label ``(first index, last index, datum index)`` at
+        # last update, used to skip re-rendering a label for the same
+        # datum.
+        self._last_ixs: dict[ContentsLabel, tuple[int, int, int]] = {}
+
+        # per-label ``(shm, shm first, shm last)`` of the source
+        # array and its cached index bounds and column views, see
+        # ``._get_cols()``.
+        self._cols: dict[
+            ContentsLabel,
+            tuple[
+                tuple[ShmArray, int, int],
+                tuple[float, float, np.ndarray, dict[str, np.ndarray]],
+            ],
+        ] = {}
+
+    def _get_cols(
+        self,
+        label: ContentsLabel,
+        viz: Viz,
+
+    ) -> tuple[float, float, np.ndarray, dict[str, np.ndarray]] | None:
+        '''
+        Return the ``(first x, last x, index column, columns)`` of the
+        label's source array where the columns are per-field (SoA)
+        views such that label updates only do scalar column reads
+        instead of indexing out (and then field-indexing) a struct
+        scalar.
+
+        The views share the shm buffer and are thus only re-split,
+        and the first/last x re-read, when the buffer (eg. on
+        a symbol switch) or its bounds change; ``None`` is returned
+        if the array is empty.
+
+        '''
+        shm = viz.shm
+        key = (shm, shm._first.value, shm._last.value)
+        entry = self._cols.get(label)
+        if (
+            entry is None
+            or entry[0] != key
+        ):
+            array = shm._array[key[1]:key[2]]
+            index = array[viz.index_field]
+            entry = self._cols[label] = (
+                key,
+                (
+                    index[0],
+                    index[-1],
+                    index,
+                    {name: array[name] for name in array.dtype.names},
+                ) if index.size else None,
+            )
+
+        return entry[1]
+
     def update_labels(
         self,
         x_in: int,
@@ -273,11 +476,11 @@ class ContentsLabels:
         for chart, name, label, update in self._labels:
 
             viz = chart.get_viz(name)
-            array = viz.shm.array
-            index = array[viz.index_field]
-            start = index[0]
-            stop = index[-1]
+            cols = self._get_cols(label, viz)
+            if cols is None:
+                continue
 
+            start, stop, index, cols = cols
             if not (
                 x_in >= start
                 and x_in <= stop
@@ -286,13 +489,27 @@ class ContentsLabels:
                 print('WTF out of range?')
                 continue
 
+            # the cursor is still over the same historical (and thus
+            # unchanged) datum as the last update; only the last,
+            # live, datum's values can change between updates.
+            # NOTE: the buffer's extent is part of the key such that
+            # any append (eg. the prior live bar just closed) forces
+            # a re-render of possibly stale (pre-close) values.
+            ix = np.searchsorted(index, x_in)
+            key = (start, stop, ix)
+            if (
+                ix < index.size - 1
+                and self._last_ixs.get(label) == key
+            ):
+                continue
+
             # call provided update func with data point
             try:
                 label.show()
-                ix = np.searchsorted(index, x_in)
-                if ix > len(array):
+                if ix > index.size:
                     breakpoint()
-                update(ix, array)
+                update(ix, cols)
+                self._last_ixs[label] = key
 
             except IndexError:
                 log.exception(f"Failed to update label: {name}")
@@ -301,6 +518,9 @@ class ContentsLabels:
         for chart, name, label, update in self._labels:
             label.hide()
 
+        # always re-render on next show
+        self._last_ixs.clear()
+
     def add_label(
 
         self,
@@ -340,6 +560,12 @@ class Cursor(pg.GraphicsObject):
 
         self.linked = linkedsplits
         self.graphics: dict[str, pg.GraphicsObject] = {}
+
+        # per-plot ``(plot, vertical line, curve cursors)`` bindings
+        # iterated on every x-move, appended to in ``.add_plot()``.
+        self._xhairs: list[
+            tuple[ChartPlotWidget, pg.InfiniteLine, list[LineDot]]
+        ] = []
         self.xaxis_label: XAxisLabel | None = None
         self.always_show_xlabel: bool = True
         self.plots: list['PlotChartWidget'] = []  # type: ignore # noqa
@@ -350,16 +576,8 @@ class Cursor(pg.GraphicsObject):
         self._hovered: set[pg.GraphicsObject] = set()
         self._trackers: set[pg.GraphicsObject] = set()
 
-        # XXX: not sure why these are instance variables?
-        # It's not like we can change them on the fly..?
-        self.pen = pg.mkPen(
-            color=hcolor('bracket'),
-            style=QtCore.Qt.DashLine,
-        )
-        self.lines_pen = pg.mkPen(
-            color=hcolor('davies'),
-            style=QtCore.Qt.DashLine,
-        )
+        self.pen = _ch_pen
+        self.lines_pen = _ch_lines_pen
 
         # value used for rounding y-axis discreet tick steps
         # computing once, up front, here cuz why not
@@ -377,6 +595,23 @@ class Cursor(pg.GraphicsObject):
         self.contents_labels = ContentsLabels(self.linked)
         self._in_query_mode: bool = False
 
+        # a single (leading + trailing edge) throttle for mouse moves
+        # over *all* tracked plots, see ``._on_mouse_moved()``.
+        timer = self._move_timer = QtCore.QTimer(self)
+        timer.setSingleShot(True)
+        timer.setTimerType(QtCore.Qt.PreciseTimer)
+        timer.setInterval(int(1e3 / _mouse_rate_limit))
+        timer.timeout.connect(self._flush_mouse_moved)
+        self._pending_pos: QPointF | None = None
+
+        # scratch point (re)used for view -> local mappings in
+        # ``.mouseMoved()`` to avoid a (sip wrapped) alloc per move.
+        self._view_pt = QPointF()
+
+        # ``(int scene x, datum index)`` of the last x-axis label
+        # update, see ``.mouseMoved()``.
+        self._last_label_xi: tuple[int, int] | None = None
+
     @property
     def in_query_mode(self) -> bool:
         return self._in_query_mode
@@ -415,6 +650,11 @@ class Cursor(pg.GraphicsObject):
         # add ``pg.graphicsItems.InfiniteLine``s
         # vertical and horizonal lines and a y-axis label
 
+        # NOTE: the lines are intentionally *not* grouped under
+        # a ``QGraphicsItemGroup``: scene updates are already
+        # coalesced by Qt into a single repaint per event loop
+        # iteration, the lines are shown/hidden independently and an
+        # item group would take over their (child) event handling.
         vl = plot.addLine(x=0, pen=self.lines_pen, movable=False)
         vl.setCacheMode(QtWidgets.QGraphicsItem.DeviceCoordinateCache)
 
@@ -432,33 +672,25 @@ class Cursor(pg.GraphicsObject):
         )
         yl.hide()  # on startup if mouse is off screen
 
-        # TODO: checkout what ``.sigDelayed`` can be used for
-        # (emitted once a sufficient delay occurs in mouse movement)
-        px_moved = pg.SignalProxy(
-            plot.scene().sigMouseMoved,
-            rateLimit=_mouse_rate_limit,
-            slot=self.mouseMoved,
-            delay=_debounce_delay,
-        )
+        plot.scene().sigMouseMoved.connect(self._on_mouse_moved)
+
+        # NOTE: enter/leave events are rare, synchronous state flips so
+        # there's no need for rate-limiting (timer backed) proxies;
+        # connect them directly. The signals emit the plot itself.
+        plot.sig_mouse_enter.connect(partial(self.mouseAction, 'Enter'))
+        plot.sig_mouse_leave.connect(partial(self.mouseAction, 'Leave'))
 
-        px_enter = pg.SignalProxy(
-            plot.sig_mouse_enter,
-            rateLimit=_mouse_rate_limit,
-            slot=lambda: self.mouseAction('Enter', plot),
-            delay=_debounce_delay,
-        )
-        px_leave = pg.SignalProxy(
-            plot.sig_mouse_leave,
-            rateLimit=_mouse_rate_limit,
-            slot=lambda: self.mouseAction('Leave', plot),
-            delay=_debounce_delay,
-        )
         self.graphics[plot] = {
             'vl': vl,
             'hl': hl,
             'yl': yl,
-            'px': (px_moved, px_enter, px_leave),
+
+            # curve "dot" cursors, see ``.add_curve_cursor()``.
+            'cursors': [],
         }
+        self._xhairs.append(
+            (plot, vl, self.graphics[plot]['cursors'])
+        )
         self.plots.append(plot)
 
         # Determine where to place x-axis label.
@@ -489,21 +721,24 @@ class Cursor(pg.GraphicsObject):
         self,
         chart: ChartPlotWidget,  # noqa
         curve: 'PlotCurveItem',  # noqa
+        viz: Viz | None = None,
 
     ) -> LineDot:
         # if this chart contains curves add line dot "cursors" to denote
         # the current sample under the mouse
         main_viz = chart.get_viz(chart.name)
+        viz = viz or main_viz
 
         # read out last index
         i = main_viz.shm.array[-1]['index']
         cursor = LineDot(
             curve,
             index=i,
-            plot=chart
+            plot=chart,
+            viz=viz,
         )
         chart.addItem(cursor)
-        self.graphics[chart].setdefault('cursors', []).append(cursor)
+        self.graphics[chart]['cursors'].append(cursor)
         return cursor
 
     def mouseAction(
@@ -539,6 +774,33 @@ class Cursor(pg.GraphicsObject):
             ):
                 self.xaxis_label.hide()
 
+    def _on_mouse_moved(
+        self,
+        pos: QPointF,
+
+    ) -> None:
+        '''
+        Rate limit scene mouse moves to at most one ``.mouseMoved()``
+        per ``_mouse_rate_limit`` period: the first move is handled
+        immediately and any arriving during the following period are
+        coalesced such that only the latest position is handled once
+        it elapses.
+
+        '''
+        if self._move_timer.isActive():
+            self._pending_pos = pos
+            return
+
+        self.mouseMoved((pos,))
+        self._move_timer.start()
+
+    def _flush_mouse_moved(self) -> None:
+        pos = self._pending_pos
+        if pos is not None:
+            self._pending_pos = None
+            self.mouseMoved((pos,))
+            self._move_timer.start()
+
     def mouseMoved(
         self,
         coords: tuple[QPointF],  # noqa
@@ -566,14 +828,25 @@ class Cursor(pg.GraphicsObject):
         # (this saves draw cycles on small mouse moves)
         last_ix, last_iy = self._datum_xy
 
-        ix = round(x)  # since bars are centered around index
-
-        # px perfect...
-        line_offset = self._lw / 2
+        # since bars are centered around index; NOTE: a truncating
+        # ``int()`` cast is cheaper then ``round()`` and equivalent
+        # for the (always non-negative) x-domain of our indexes.
+        ix = int(x + 0.5)
 
         # round y value to nearest tick step
         m = self._y_tick_mult
         iy = round(y * m) / m
+
+        # sub-datum (pixel jitter) move in both dimensions, nothing
+        # to redraw.
+        if (
+            ix == last_ix
+            and iy == last_iy
+        ):
+            return
+
+        # px perfect...
+        line_offset = self._lw / 2
         vl_y = iy - line_offset
         # print(
         #     f'tick: {self._y_tick}\n'
@@ -582,19 +855,24 @@ class Cursor(pg.GraphicsObject):
         #     f'vl_y: {vl_y}\n'
         # )
 
+        view_pt = self._view_pt
+
         # update y-range items
         if iy != last_iy:
 
             if self._y_label_update:
-                self.graphics[self.active_plot]['yl'].update_label(
+                opts = self.graphics[plot]
+                view_pt.setX(ix)
+                view_pt.setY(vl_y)
+                opts['yl'].update_label(
                     # abs_pos=plot.mapFromView(QPointF(ix, iy)),
-                    abs_pos=plot.mapFromView(QPointF(ix, vl_y)),
+                    abs_pos=plot.mapFromView(view_pt),
                     value=iy
                 )
 
                 # only update horizontal xhair line if label is enabled
-                # self.graphics[plot]['hl'].setY(iy)
-                self.graphics[plot]['hl'].setY(vl_y)
+                # opts['hl'].setY(iy)
+                opts['hl'].setY(vl_y)
 
             # update all trackers
             for item in self._trackers:
@@ -608,14 +886,18 @@ class Cursor(pg.GraphicsObject):
                 self.contents_labels.update_labels(ix)
 
             vl_x = ix + line_offset
-            for plot, opts in self.graphics.items():
+            for plot, vl, cursors in self._xhairs:
 
                 # move the vertical line to the current "center of bar"
-                opts['vl'].setX(vl_x)
+                vl.setX(vl_x)
 
-                # update all subscribed curve dots
-                for cursor in opts.get('cursors', ()):
-                    cursor.setIndex(ix)
+                # update all subscribed curve dots, but only on plots
+                # that are actually shown.
+                if (
+                    cursors
+                    and plot.isVisible()
+                ):
+                    update_dots(cursors, ix)
 
                 # Update the label on the bottom of the crosshair.
                 # TODO: make this an up-front calc that we update
@@ -637,13 +919,26 @@ class Cursor(pg.GraphicsObject):
                     self.always_show_xlabel
                     or self.xaxis_label.isVisible()
                 ):
-                    self.xaxis_label.update_label(
-                        abs_pos=(
-                            plot.mapFromView(QPointF(vl_x, iy)) -
-                            QPointF(left_axis_width, 0)
-                        ),
-                        value=ix,
-                    )
+                    view_pt.setX(vl_x)
+                    view_pt.setY(iy)
+
+                    # NOTE: the mapped point is a new instance so it's
+                    # fine to offset it in place.
+                    abs_pos = plot.mapFromView(view_pt)
+                    label_x = abs_pos.x() - left_axis_width
+
+                    # skip the label (text and position) update when
+                    # it'd render the same datum at the same pixel
+                    # column, eg. for every plot after the first with
+                    # the same left axis offset.
+                    label_xi = (int(label_x), ix)
+                    if label_xi != self._last_label_xi:
+                        self._last_label_xi = label_xi
+                        abs_pos.setX(label_x)
+                        self.xaxis_label.update_label(
+                            abs_pos=abs_pos,
+                            value=ix,
+                        )
 
         self._datum_xy = ix, iy
 
@@ -18,6 +18,7 @@
 Double auction top-of-book (L1) graphics.
 
 """
+import re
 from typing import Tuple
 
 import pyqtgraph as pg
@@ -29,6 +30,11 @@ from ._style import hcolor
 from ._pg_overrides import PlotItem
 
 
+# matches nested precision fields in a format string, eg. the
+# ``{level_digits}`` in ``'{level:,.{level_digits}f}'``.
+_digits_field = re.compile(r'\{(\w+_digits)\}')
+
+
 class LevelLabel(YAxisLabel):
     '''
     Y-axis (vertically) oriented, horizontal label that sticks to
@@ -103,6 +109,10 @@ class LevelLabel(YAxisLabel):
             'right': 0.,
         }[orient_h]
 
+        # (pixel y, x-offset, rendered fields) of the last label
+        # update, see ``.update_label()``.
+        self._last_key: tuple | None = None
+
         self.fields = self._fields.copy()
         # ensure default format fields are in correct
         self.set_fmt_str(self._fmt_str, self.fields)
@@ -139,6 +149,10 @@ class LevelLabel(YAxisLabel):
         self.fields.update(fields)
         level = self.fields['level']
 
+        # precision changed, re-specialize the format string.
+        if any(key.endswith('_digits') for key in fields):
+            self._compile_fmt(self.fields)
+
         # map "level" to local coords
         abs_xy = self._pi.mapFromView(QPointF(0, level))
 
@@ -153,12 +167,31 @@ class LevelLabel(YAxisLabel):
         fields: dict,
     ) -> None:
 
-        # write contents, type specific
-        h, w = self.set_label_str(fields)
-
         if self._adjust_to_l1:
             self._x_offset = self._pi.chart_widget._max_l1_line_len
 
+        # skip the re-format, re-size and re-paint entirely when
+        # neither the rendered (rounded) level, any other field nor
+        # the (pixel) position has changed since the last update.
+        key = (
+            round(abs_pos.y()),
+            self._x_offset,
+            tuple(
+                round(
+                    value,
+                    fields.get('level_digits', self.digits),
+                ) if name == 'level' else value
+                for name, value in fields.items()
+            ),
+        )
+        if key == self._last_key:
+            return
+
+        self._last_key = key
+
+        # write contents, type specific
+        h, w = self.set_label_str(fields)
+
         self.setPos(QPointF(
             self._h_shift * (w + self._x_offset),
             abs_pos.y() + self._v_shift * h
@@ -173,17 +206,34 @@ class LevelLabel(YAxisLabel):
     ) -> (str, str):
         # test that new fmt str can be rendered
         self._fmt_str = fmt_str
+        self._last_key = None
+        self._compile_fmt(fields)
         self.set_label_str(fields)
         self.fields.update(fields)
         return fmt_str, self.label_str
 
+    def _compile_fmt(
+        self,
+        fields: dict,
+    ) -> None:
+        '''
+        "Specialize" the format string by resolving any nested
+        ``*_digits`` precision fields up front such that each
+        ``.set_label_str()`` call is a single flat ``str.format()``
+        instead of re-parsing the nested format-spec every time.
+
+        '''
+        self._fmt = _digits_field.sub(
+            lambda m: str(fields[m.group(1)]),
+            self._fmt_str,
+        ).format
+
     def set_label_str(
         self,
         fields: dict,
     ):
         # use space as e3 delim
-        self.label_str = self._fmt_str.format(
-            **fields).replace(',', ' ')
+        self.label_str = self._fmt(**fields).replace(',', ' ')
 
         br = self.boundingRect()
         h, w = br.height(), br.width()
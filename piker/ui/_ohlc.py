@@ -62,12 +62,10 @@ def bar_from_ohlc_row(
     mid: float = (bar_w / 2) + index
 
     # high -> low vertical (body) line
-    if low != high:
-        hl = QLineF(mid, low, mid, high)
-    else:
-        # XXX: if we don't do it renders a weird rectangle?
-        # see below for filtering this later...
-        hl = None
+    # XXX: if drawn when ``low == high`` it renders a weird rectangle,
+    # so callers must track whether to draw it, see
+    # ``BarItems._last_bar_has_body``.
+    hl = QLineF(mid, low, mid, high)
 
     # NOTE: place the x-coord start as "middle" of the drawing range such
     # that the open arm line-graphic is at the left-most-side of
@@ -100,33 +98,57 @@ class BarItems(FlowGraphic):
         super().__init__(*args, **kwargs)
         self._last_bar_lines: tuple[QLineF, ...] | None = None
 
+        # whether the last bar has a (non-flat) high-low "body" line;
+        # tracked separately from the lines themselves (which are
+        # never ``None``) so that the paint and bounding rect paths
+        # never have to scan for and filter out a missing body.
+        self._last_bar_has_body: bool = False
+
+        # the last bar's (close arm right-most x, low, high) as plain
+        # floats, written on every update so that reads don't need to
+        # round-trip through (sip wrapped) ``QLineF`` getters.
+        self._last_bar_span: tuple[float, float, float] | None = None
+
+        # cached bounding rect, invalidated whenever either the
+        # history path or the last bar's lines are (re)drawn.
+        self._br: QRectF | None = None
+
     def x_last(self) -> None | float:
         '''
         Return the last most x value of the close line segment
         or if not drawn yet, ``None``.
 
         '''
-        if self._last_bar_lines:
-            close_arm_line = self._last_bar_lines[-1]
-            if close_arm_line:
-                return close_arm_line.x2()
+        span = self._last_bar_span
+        if span:
+            return span[0]
 
         return None
 
+    def prepareGeometryChange(self) -> None:
+        '''
+        Invalidate our cached bounding rect before notifying Qt since
+        this is always called (by the ``Viz``) after a path (re)render.
+
+        '''
+        self._br = None
+        super().prepareGeometryChange()
+
     # Qt docs: https://doc.qt.io/qt-5/qgraphicsitem.html#boundingRect
     def boundingRect(self):
+        # NOTE: Qt queries this many times per paint/hover/scroll
+        # event but our graphics only change when a new path is
+        # rendered or the last bar is updated, so cache it.
+        br = self._br
+        if br is not None:
+            return br
+
         # profiler = Profiler(
         #     msg=f'BarItems.boundingRect(): `{self._name}`',
         #     disabled=not pg_profile_enabled(),
         #     ms_threshold=ms_slower_then,
         # )
 
-        # TODO: Can we do rect caching to make this faster
-        # like `pg.PlotCurveItem` does? In theory it's just
-        # computing max/min stuff again like we do in the udpate loop
-        # anyway. Not really sure it's necessary since profiling already
-        # shows this method is faf.
-
         # boundingRect _must_ indicate the entire area that will be
         # drawn on or else we will get artifacts and possibly crashing.
         # (in this case, QPicture does all the work of computing the
@@ -146,31 +168,23 @@ class BarItems(FlowGraphic):
         # profiler('calc path vertices')
 
         # need to include last bar height or BR will be off
-        # OHLC line segments: [hl, o, c]
-        last_lines: tuple[QLineF] | None = self._last_bar_lines
-        if last_lines:
-            (
-                hl,
-                o,
-                c,
-            ) = last_lines
-            most_right = c.x2() + 1
-            ymx = ymn = c.y2()
-
-            if hl:
-                y1, y2 = hl.y1(), hl.y2()
-                ymn = min(y1, y2)
-                ymx = max(y1, y2)
+        span: tuple[float, float, float] | None = self._last_bar_span
+        if span:
+            x_r, ymn, ymx = span
+            most_right = x_r + 1
+
+            if self._last_bar_has_body:
                 mx_y = max(ymx, mx_y)
                 mn_y = min(ymn, mn_y)
                 # profiler('calc last bar vertices')
 
-        return QRectF(
+        br = self._br = QRectF(
             most_left,
             mn_y,
             most_right - most_left + 1,
             mx_y - mn_y,
         )
+        return br
 
     def paint(
         self,
@@ -193,9 +207,22 @@ class BarItems(FlowGraphic):
         # as is necesarry for what's in "view". Not sure if this will
         # lead to any perf gains other then when zoomed in to less bars
         # in view.
+
+        # NOTE: there's no need to composite the history path and
+        # last bar into a single (cached) picture here since
+        # ``FlowGraphic.cache_mode`` (``DeviceCoordinateCache``)
+        # already has Qt blit a cached pixmap of *both* on hover,
+        # cursor and other scene-only repaints; this method is only
+        # re-entered on an explicit ``.update()`` or a view change.
         p.setPen(self.last_step_pen)
-        if self._last_bar_lines:
-            p.drawLines(*tuple(filter(bool, self._last_bar_lines)))
+        last_lines = self._last_bar_lines
+        if last_lines:
+            body, larm, rarm = last_lines
+            if self._last_bar_has_body:
+                p.drawLines(body, larm, rarm)
+            else:
+                p.drawLines(larm, rarm)
+
             profiler('draw last bar')
 
         p.setPen(self._pen)
@@ -212,19 +239,19 @@ class BarItems(FlowGraphic):
 
     ) -> None:
 
-        # relevant fields
-        fields: list[str] = [
-            'open',
-            'high',
-            'low',
-            'close',
-            index_field,
-        ]
-        ohlc = src_data[fields]
-        # last_row = ohlc[-1:]
+        # NOTE: only the last (current) bar is ever (re)drawn here so
+        # read just that row's fields instead of building
+        # a multi-field view over the entire source array.
+        row = src_data[-1]
 
         # individual values
-        last_row = o, h, l, last, i = ohlc[-1]
+        last_row = o, h, l, last, i = (
+            row['open'],
+            row['high'],
+            row['low'],
+            row['close'],
+            row[index_field],
+        )
 
         # times = src_data['time']
         # if times[-1] - times[-2]:
@@ -233,37 +260,45 @@ class BarItems(FlowGraphic):
         index = src_data[index_field]
         step_size = index[-1] - index[-2]
 
-        # generate new lines objects for updatable "current bar"
+        # last bar geometry is about to change
+        self._br = None
+
         bg: float = 0.16 * step_size
-        self._last_bar_lines = bar_from_ohlc_row(
-            last_row,
-            bar_w=step_size,
-            bar_gap=bg,
-        )
+        mid: float = (step_size / 2) + i
+
+        # generate lines objects for the updatable "current bar" only
+        # once, from then on we just mutate them in place.
+        lines = self._last_bar_lines
+        if lines is None:
+            lines = self._last_bar_lines = bar_from_ohlc_row(
+                last_row,
+                bar_w=step_size,
+                bar_gap=bg,
+            )
 
         # assert i == graphics.start_index - 1
         # assert i == last_index
-        body, larm, rarm = self._last_bar_lines
+        body, larm, rarm = lines
 
-        # XXX: is there a faster way to modify this?
-        rarm.setLine(rarm.x1(), last, rarm.x2(), last)
+        # NOTE: always set all coords (not just the y-values) from the
+        # known bar geometry since the x-index changes whenever a new
+        # bar is started; this also avoids reading them back out via
+        # the ``QLineF.x1()/.x2()`` getters.
+        x_r: float = i + step_size - bg
+        self._last_bar_span = (x_r, l, h)
+        rarm.setLine(mid, last, x_r, last)
 
         # writer is responsible for changing open on "first" volume of bar
-        larm.setLine(larm.x1(), o, larm.x2(), o)
+        larm.setLine(i + bg, o, mid, o)
 
-        if l != h:  # noqa
-
-            if body is None:
-                body = self._last_bar_lines[0] = QLineF(
-                    i + bg, l,
-                    i + step_size - bg, h,
-                )
-            else:
-                # update body
-                body.setLine(
-                    body.x1(), l,
-                    body.x2(), h,
-                )
+        has_body: bool = l != h  # noqa
+        self._last_bar_has_body = has_body
+        if has_body:
+            # update body
+            body.setLine(
+                mid, l,
+                mid, h,
+            )
 
             # XXX: pretty sure this is causing an issue where the
             # bar has a large upward move right before the next
@@ -274,4 +309,4 @@ class BarItems(FlowGraphic):
             # date / from some previous sample. It's weird though
             # because i've seen it do this to bars i - 3 back?
 
-        return ohlc[index_field], ohlc['close']
+        return index, src_data['close']
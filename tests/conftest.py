@@ -12,7 +12,10 @@ from piker import (
 from piker.service import (
     Services,
 )
-from piker.log import get_console_log
+from piker.log import (
+    get_console_log,
+    get_logger,
+)
 
 
 def pytest_addoption(parser):
@@ -68,19 +71,29 @@ def ci_env() -> bool:
     return _ci_env
 
 
-@pytest.fixture()
+@pytest.fixture(scope='session')
 def log(
-    request: pytest.FixtureRequest,
     loglevel: str,
 ) -> logging.Logger:
     '''
-    Deliver a per-test-named ``piker.log`` instance.
+    Deliver the ``piker`` package log with a console handler
+    enabled (once) for the whole test session.
 
     '''
-    return get_console_log(
-        level=loglevel,
-        name=request.node.name,
-    )
+    return get_console_log(level=loglevel)
+
+
+@pytest.fixture()
+def test_log(
+    request: pytest.FixtureRequest,
+    log: logging.Logger,
+) -> logging.Logger:
+    '''
+    Deliver a per-test-named ``piker.log`` instance which is a child
+    of (and thus reuses the handler from) the session ``log``.
+
+    '''
+    return get_logger(request.node.name)
 
 
 @acm
@@ -107,11 +120,17 @@ async def _open_test_pikerd(
     to boot the root actor / tractor runtime.
 
     '''
-    import random
+    import socket
     from piker.service import maybe_open_pikerd
 
     if reg_addr is None:
-        port = random.randint(6e3, 7e3)
+        # NOTE: let the kernel pick a (currently) free port instead
+        # of guessing one at random which can collide with other
+        # (possibly parallel) test runs.
+        with socket.socket() as s:
+            s.bind(('127.0.0.1', 0))
+            port = s.getsockname()[1]
+
         reg_addr = ('127.0.0.1', port)
 
     async with (
@@ -0,0 +1,80 @@
+'''
+OHLC bar path vertex generation from ``piker.data._pathops``.
+
+'''
+import numpy as np
+import pytest
+
+from piker.data._source import base_iohlc_dtype
+from piker.data._pathops import path_arrays_from_ohlc
+
+
+def mk_ohlc() -> np.ndarray:
+    ohlc = np.zeros(3, dtype=base_iohlc_dtype)
+    ohlc['index'] = [10, 11, 12]
+    ohlc['time'] = [60., 120., 180.]
+    ohlc['open'] = [1., 2., 3.]
+    ohlc['high'] = [4., 5., 6.]
+    ohlc['low'] = [0.5, 1.5, 2.5]
+    ohlc['close'] = [2., 3., 4.]
+    return ohlc
+
+
+@pytest.mark.parametrize(
+    'use_time_index',
+    [True, False],
+    ids=lambda use_time: 'time' if use_time else 'index',
+)
+@pytest.mark.parametrize('start', [0, 1, 3])
+def test_path_arrays_vertex_layout(
+    use_time_index: bool,
+    start: int,
+):
+    '''
+    Every bar is drawn as 6 connected vertices:
+    open arm start, open, low, high, close and close arm end with
+    the last vertex never connected to the next bar's first; any
+    slots before ``start`` are left zeroed.
+
+    '''
+    ohlc = mk_ohlc()
+    bar_w: float = 1.
+    bar_gap: float = 0.16
+
+    x, y, c = path_arrays_from_ohlc(
+        ohlc,
+        start,
+        bar_w=bar_w,
+        bar_gap=bar_gap,
+        use_time_index=use_time_index,
+    )
+    assert x.shape == y.shape == c.shape == (ohlc.size * 6,)
+
+    index = ohlc['time' if use_time_index else 'index']
+    for i, row in enumerate(ohlc):
+        vxs = x[i*6:i*6 + 6]
+        vys = y[i*6:i*6 + 6]
+        vcs = c[i*6:i*6 + 6]
+
+        if i < start:
+            assert not vxs.any()
+            assert not vys.any()
+            assert not vcs.any()
+            continue
+
+        x0 = index[i]
+        mid = x0 + bar_w/2
+        assert list(vxs) == [
+            x0 + bar_gap,
+            mid, mid, mid, mid,
+            x0 + bar_w - bar_gap,
+        ]
+        assert list(vys) == [
+            row['open'],
+            row['open'],
+            row['low'],
+            row['high'],
+            row['close'],
+            row['close'],
+        ]
+        assert list(vcs) == [1, 1, 1, 1, 1, 0]